@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+
+import numpy as np
+import sys, time
+import argparse
+import logging
+
+loggerFormat = '%(asctime)-15s %(filename)s  %(message)s'
+logging.basicConfig(format = loggerFormat, level=logging.WARNING)
+logger = logging.getLogger()
+
+import katpoint
+from mosaic.beamforming import DelayPolynomial
+
+referenceString = "ref, -30:42:39.8, 21:26:38.0, 1035.0"
+
+def makeZeroNIAOAntennas(antennaNum, radius):
+    """
+    antennas scattered around the reference with a delay model of
+    east north up offsets, no fixed delays and a zero NIAO
+    """
+    np.random.seed(0)
+    offsets = np.random.uniform(-radius, radius, (antennaNum, 3))
+    offsets[:, 2] *= 0.01
+    antennaKat = []
+    for idx, (east, north, up) in enumerate(offsets):
+        antennaKat.append(katpoint.Antenna(
+            "m{:03d}, -30:42:39.8, 21:26:38.0, 1035.0, 13.5, "
+            "{:.3f} {:.3f} {:.3f} 0.0 0.0 0.0".format(idx, east, north, up)))
+    return antennaKat
+
+def makeBeams(boresight, beamNum, spread):
+    np.random.seed(1)
+    offsets = np.random.uniform(-spread, spread, (beamNum, 2))
+    return np.array(boresight) + offsets
+
+def timeMethod(delayPolynomial, epoch, method):
+    start = time.time()
+    polynomials = delayPolynomial.get_delay_polynomials(epoch, method = method)
+    return polynomials, time.time() - start
+
+def checkDelay(antennaNum, beamNum, radius, spread, boresight, epoch):
+    antennas = makeZeroNIAOAntennas(antennaNum, radius)
+    reference = katpoint.Antenna(referenceString)
+    beams = makeBeams(boresight, beamNum, spread)
+    delayPolynomial = DelayPolynomial(antennas, boresight, beams, reference)
+
+    katpointPoly, katpointTime = timeMethod(delayPolynomial, epoch, "katpoint")
+    vectorizedPoly, vectorizedTime = timeMethod(delayPolynomial, epoch, "vectorized")
+
+    delayDiff = np.amax(np.abs(katpointPoly[:, :, 0] - vectorizedPoly[:, :, 0]))
+    rateDiff = np.amax(np.abs(katpointPoly[:, :, 1] - vectorizedPoly[:, :, 1]))
+    delayScale = np.amax(np.abs(katpointPoly[:, :, 0]))
+    rateScale = np.amax(np.abs(katpointPoly[:, :, 1]))
+
+    print("antennas: {}, beams: {}".format(antennaNum, beamNum))
+    print("max delay difference: {:.3g} s (max delay {:.3g} s)".format(delayDiff, delayScale))
+    print("max rate difference: {:.3g} s/s (max rate {:.3g} s/s)".format(rateDiff, rateScale))
+    print("katpoint: {:.3f} s, vectorized: {:.3f} s, speedup: {:.1f}".format(
+        katpointTime, vectorizedTime, katpointTime / vectorizedTime))
+
+    # opposite signs would show up as differences as large as the delays
+    if delayDiff > 1e-6 * delayScale or rateDiff > 1e-6 * rateScale:
+        logger.critical("the vectorized delay polynomials differ from katpoint")
+        return False
+    return True
+
+def parseOptions(parser):
+    parser.add_argument('--ants', nargs=1, metavar="number", type=int, default=[64], help='number of antennas')
+    parser.add_argument('--beams', nargs=1, metavar="number", type=int, default=[800], help='number of beams')
+    parser.add_argument('--radius', nargs=1, metavar="meter", type=float, default=[4000.], help='extent of the array')
+    parser.add_argument('--spread', nargs=1, metavar="degree", type=float, default=[0.5], help='extent of the beams around the boresight')
+    parser.add_argument('--source', nargs=2, metavar=("RA", "DEC"), type=float, default=[30., -40.], help='boresight in degree')
+    parser.add_argument('--epoch', nargs=1, metavar="seconds", type=float, default=[1588399333.], help='observation time in epoch seconds')
+
+    args = parser.parse_args()
+
+    return checkDelay(args.ants[0], args.beams[0], args.radius[0],
+            args.spread[0], args.source, args.epoch[0])
+
+def main():
+    parser = argparse.ArgumentParser(description=
+        'compare the vectorized delay polynomials against katpoint '
+        'for an array without non-intersecting axis offsets')
+    if not parseOptions(parser):
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -51,20 +51,21 @@ class PsfSim(object):
 
         """
         def from_katpoint_list(antennas):
-            antenna_list = []
-            for antenna in antennas:
-                antenna_list.append([np.rad2deg(antenna.observer.lat),
-                                    np.rad2deg(antenna.observer.lon),
-                                    antenna.observer.elev])
-            return np.array(antenna_list)
-        antennas = np.array(antennas)
-        if isinstance(antennas[0], np.ndarray):
-            antenna_coordinates = antennas
+            antenna_list = np.empty((len(antennas), 3))
+            for idx, antenna in enumerate(antennas):
+                antenna_list[idx] = (antenna.observer.lat,
+                                    antenna.observer.lon,
+                                    antenna.observer.elev)
+            antenna_list[:, :2] = np.rad2deg(antenna_list[:, :2])
+            return antenna_list
+        first = antennas[0]
+        if isinstance(first, (np.ndarray, list, tuple)):
+            antenna_coordinates = np.asarray(antennas, dtype=float)
             names = ["%03d" % i for i in range(len(antennas))]
-        elif isinstance(antennas[0], katpoint.Antenna):
+        elif isinstance(first, katpoint.Antenna):
             antenna_coordinates = from_katpoint_list(antennas)
             names = [ant.name for ant in antennas]
-        elif isinstance(antennas[0], str):
+        elif isinstance(first, str):
             katpoint_antennas = [katpoint.Antenna(i) for i in antennas]
             antenna_coordinates = from_katpoint_list(katpoint_antennas)
             names = [ant.name for ant in katpoint_antennas]
@@ -90,13 +91,10 @@ class PsfSim(object):
         a coordinate as [RA, DEC]
 
         """
-        if (isinstance(source, np.ndarray) or isinstance(source, list) or
-                isinstance(source, tuple)):
+        if isinstance(source, (np.ndarray, list, tuple)):
             return source
         elif isinstance(source, katpoint.Target):
-            ra = source.body._ra
-            dec = source.body._dec
-            return (str(ra), str(dec))
+            return np.rad2deg([source.body._ra, source.body._dec])
         else:
             raise Exception("source are passed in unknown format")
 
@@ -164,6 +162,11 @@ class BeamShape(object):
         self.reference_antenna = reference_antenna
         self.horizon = horizon
         self.resolution = resolution
+        self._width_cache = {}
+        bottomOverlap = beamshapeModel[0, 0]
+        topOverlap = beamshapeModel[-1, 0]
+        self._overlap_bottom = bottomOverlap
+        self._overlap_scale = (beamshapeModel.shape[0] - 1) / (topOverlap-bottomOverlap)
 
     def width_at_overlap(self, overlap):
         """
@@ -176,13 +179,26 @@ class BeamShape(object):
         # widthH = normInverse(overlap, 0, sigmaH)
         # widthV = normInverse(overlap, 0, sigmaV)
 
-        bottomOverlap = self.beamshapeModel[0, 0]
-        topOverlap = self.beamshapeModel[-1, 0]
-        index = (overlap - bottomOverlap) / (topOverlap-bottomOverlap) * (self.beamshapeModel.shape[0] - 1)
+        if overlap in self._width_cache:
+            return self._width_cache[overlap]
+
+        index = (overlap - self._overlap_bottom) * self._overlap_scale
         axisH, axisV, angle = self.beamshapeModel[int(np.round(index))][1:]
 
+        self._width_cache[overlap] = (axisH, axisV, angle)
         return axisH, axisV, angle
 
+    def widths_at_overlaps(self, overlaps):
+        """
+        vectorized version of width_at_overlap for a list of overlap levels.
+
+        return:
+        an array of [axisH, axisV, angle] in the order of the overlaps
+        """
+        indices = (np.asarray(overlaps) - self._overlap_bottom) * self._overlap_scale
+
+        return self.beamshapeModel[np.round(indices).astype(int), 1:]
+
     def plot_psf(self, filename, overlap = 0.5, shape_overlay = False,
             colormap = False, interpolation = True ):
         """
@@ -228,6 +244,7 @@ class Overlap(object):
 
         self.metrics  = metrics
         self.mode = mode
+        self._counts = None
 
     def plot(self, filename, scope = 1., axis = True):
         """
@@ -253,10 +270,12 @@ class Overlap(object):
 
         if self.mode != "counter":
             raise Exception("the fraction calculation is only supportted in counter mode")
-        overlap_counter = self.metrics
-        overlap_grid = np.count_nonzero(overlap_counter > 1)
-        non_overlap_grid = np.count_nonzero(overlap_counter == 1)
-        empty_grid = np.count_nonzero(overlap_counter == 0)
+        if self._counts is None:
+            non_overlapped = np.count_nonzero(self.metrics == 1)
+            empty = np.count_nonzero(self.metrics == 0)
+            self._counts = (empty, non_overlapped,
+                    self.metrics.size - non_overlapped - empty)
+        empty_grid, non_overlap_grid, overlap_grid = self._counts
         point_num = overlap_grid+non_overlap_grid+empty_grid
         overlapped, non_overlapped, empty = np.array([overlap_grid, non_overlap_grid,
                 empty_grid])/float(point_num)
@@ -475,19 +494,31 @@ def generate_nbeams_tiling(beam_shape, beam_num, overlap, method, tilingShape,
 
     return tiling_obj
 
+def geometric_delays(baselines, directions):
+    """
+    calculate the geometric delays to be applied to the antennas to align them
+    with the reference antenna towards a set of directions
+
+    arguments:
+    baselines -- ENU vectors from the reference antenna to the antennas in meter,
+        in the shape of (antenna, 3)
+    directions -- ENU unit vectors pointing to the targets, in the shape of (..., 3)
+
+    return:
+    delays in seconds in the shape of (..., antenna)
+    """
+    return np.dot(directions, baselines.T) / katpoint.lightspeed
+
 def dict_to_ordered_list(dict_obj):
-    ordered_list = []
-    for key in sorted(dict_obj.keys()):
-        ordered_list.append(dict_obj[key])
-    return ordered_list
+    return [dict_obj[key] for key in sorted(dict_obj)]
 
-def dict_to_antenna_ordered_list(dict_obj, antennas, pol='h'):
-    ordered_list = []
-    for antenna in antennas:
-        antenna_key = "{}{}".format(antenna.name, pol)
-        ordered_list.append(dict_obj[antenna_key])
+def antenna_keys(antennas, pol='h'):
+    return ["{}{}".format(antenna.name, pol) for antenna in antennas]
 
-    return ordered_list
+def dict_to_antenna_ordered_list(dict_obj, antennas, pol='h', keys=None):
+    if keys is None:
+        keys = antenna_keys(antennas, pol)
+    return [dict_obj[key] for key in keys]
 
 class DelayPolynomial(object):
     """
@@ -509,6 +540,7 @@ class DelayPolynomial(object):
         self.frequency = 1.4e9
         self.reference = reference
         self.bore_sight = DelayPolynomial.check_targets([bore_sight,])[0]
+        self._delay_keys = antenna_keys(self.antennas)
 
     @staticmethod
     def check_targets(targets):
@@ -541,10 +573,10 @@ class DelayPolynomial(object):
         return:
         time in epoch seconds
         """
-        if type(time) != int and type(time) != float:
-            return coord.datetimeToEpoch(time)
+        if isinstance(time, (int, float, np.integer, np.floating)):
+            return float(time)
         else:
-            return time
+            return coord.datetimeToEpoch(time)
 
     @staticmethod
     def make_katpoint_target(sources):
@@ -559,50 +591,94 @@ class DelayPolynomial(object):
         katpoint target objects
         """
 
-        targets = []
-        for source in sources:
-            target_string = ",".join(['radec',
-                            coord.angleToHour(source[0]),
-                            coord.angleToDEC(source[1])])
-            targets.append(katpoint.Target(target_string))
-        return targets
+        return [katpoint.construct_radec_target(ra, dec)
+                for ra, dec in np.deg2rad(np.asarray(sources, dtype=float)[:, :2])]
 
-    def get_delay_polynomials(self, epoch, duration=10.0):
+    def get_delay_polynomials(self, epoch, duration=10.0, method="katpoint"):
         """
         calculate and return the polynomials
 
         Arguments:
         timestamp -- the observation time in datatime object or epoch seconds
         duration -- the duration in which the polynomial is calcuated
+        method -- "katpoint" evaluates katpoint.DelayCorrection for every beam,
+                  "vectorized" evaluates the geometric delays of all beams
+                  at once, ignoring the non-intersecting axis offset term,
+                  so the two methods only agree when the NIAO is zero
 
         return:
         polynomials in the order of beam, antenna, (delay, rate)
 
         """
         timestamp = DelayPolynomial.check_time(epoch)
-        antennaObjectList = self.antennas
         timestamp = (timestamp, timestamp + duration)
 
-        target_array = []
-        for target in self.targets:
-            dc = katpoint.DelayCorrection(self.antennas,
-                    self.reference, self.frequency)
+        if method == "vectorized":
+            return self.get_geometric_delay_polynomials(timestamp)
+        elif method != "katpoint":
+            raise Exception("unknown delay polynomial method: {}".format(method))
+
+        dc = katpoint.DelayCorrection(self.antennas,
+                self.reference, self.frequency)
+        target_array = np.empty((len(self.targets), len(self.antennas), 2))
+        for idx, target in enumerate(self.targets):
             delay, phase = dc.corrections(target, timestamp)
             delayArray = np.array(dict_to_antenna_ordered_list(
-                        delay, self.antennas))
+                        delay, self.antennas, keys=self._delay_keys))
             """
             [:, 0, :]: only take first rate output
             """
-            target_array.append(delayArray[:,0,:])
-        target_array = np.array(target_array)
+            target_array[idx] = delayArray[:,0,:]
         """
         subtract the boresight beam form the offset beams
         """
-        dc = katpoint.DelayCorrection(self.antennas,
-            self.reference, self.frequency)
         delay, phase = dc.corrections(self.bore_sight, timestamp)
         bore_sight_delay = np.array(dict_to_antenna_ordered_list(
-                    delay, self.antennas))[:,0,:]
+                    delay, self.antennas, keys=self._delay_keys))[:,0,:]
 
-        target_array = target_array - bore_sight_delay
+        target_array -= bore_sight_delay
+        return target_array
+
+    def get_geometric_delay_polynomials(self, timestamp):
+        """
+        calculate the polynomials from the geometric delays of all the beams
+        with a single matrix product instead of one DelayCorrection per beam.
+        the constant cable delays cancel out in the boresight subtraction.
+
+        the directions still come from one katpoint azel call per beam, as
+        katpoint has no call for many targets at once, and this loop dominates
+        the run time. the non-intersecting axis offset (NIAO) of the antenna
+        delay models is not included, so the result only agrees with the
+        "katpoint" method when the NIAO of the antennas is zero.
+
+        Arguments:
+        timestamp -- the start and end of the polynomial in epoch seconds
+
+        return:
+        polynomials in the order of beam, antenna, (delay, rate)
+
+        """
+        baselines = np.array([self.reference.baseline_toward(antenna)
+                for antenna in self.antennas])
+        timestamps = np.array(timestamp)
+        directions = np.empty((len(self.targets) + 1, len(timestamp), 3))
+        for idx, target in enumerate([self.bore_sight] + list(self.targets)):
+            az, el = target.azel(timestamps, self.reference)
+            directions[idx] = np.array(katpoint.azel_to_enu(az, el)).T
+
+        """
+        delays in the order of beam, time, antenna
+        """
+        delays = geometric_delays(baselines, directions)
+        target_array = np.empty((len(self.targets) + 1, len(self.antennas), 2))
+        target_array[:, :, 0] = delays[:, 0, :]
+        target_array[:, :, 1] = (delays[:, 1, :] - delays[:, 0, :]) / (
+                timestamp[1] - timestamp[0])
+
+        """
+        subtract the boresight beam form the offset beams
+        """
+        bore_sight_delay = target_array[0]
+        target_array = target_array[1:]
+        target_array -= bore_sight_delay
         return target_array
@@ -354,16 +354,17 @@ class InterferometryObservation:
         np.cos(theta0)])
 
         receiverLocations = antennaENU
-        kall = np.dot(receiverLocations, sourcePosition)/waveLength
-        k0 = np.dot(receiverLocations, sourcePosition0)/waveLength
-        k = (kall.T-k0).T
+        # offset the directions instead of the [antN, beams] phases
+        k = np.dot(receiverLocations,
+                sourcePosition - sourcePosition0.reshape(3, 1)) * (2.0 * np.pi / waveLength)
 
 
-        weights = np.exp(1j * 2.0 * np.pi * k)
+        weights = np.exp(1j * k)
         # [antN, beams]
         if antennaWeights is not None and len(antennaWeights) == len(receiverLocations):
-            weights = weights * np.array(antennaWeights).reshape(-1, 1)
-        weights = weights.sum(axis=0)
+            weights = np.dot(np.array(antennaWeights), weights)
+        else:
+            weights = weights.sum(axis=0)
         image = np.abs(weights).reshape(sidelength, sidelength)
         image = np.square(image/np.amax(image))
         # image = np.square(image/len(receiverLocations))
@@ -6,10 +6,28 @@ from functools import partial
 
 logger = logging.getLogger(__name__)
 
-def createTiling(method, beamNumber, beamshape, overlap, tilingShape, parameter, error, seed=None):
+def createTilings(method, beamNumber, beamshape, overlaps, tilingShape, parameter, error, seed=None):
+    """
+    create one tiling per overlap level, looking up the beam widths of all
+    the levels at once. only the "variable_size" method takes the overlap
+    as an input, "variable_overlap" searches for the overlap by itself.
+    """
+
+    if method != "variable_size":
+        raise Exception("tiling over a list of overlaps is only supported by the variable_size method")
+
+    widths = beamshape.widths_at_overlaps(overlaps)
+    return [createTiling(method, beamNumber, beamshape, overlap, tilingShape,
+            parameter, error, seed, widths = width)
+            for overlap, width in zip(overlaps, widths)]
+
+def createTiling(method, beamNumber, beamshape, overlap, tilingShape, parameter, error, seed=None, widths=None):
 
     if method == "variable_size":
-        axisH, axisV, angle = beamshape.width_at_overlap(overlap)
+        if widths is None:
+            axisH, axisV, angle = beamshape.width_at_overlap(overlap)
+        else:
+            axisH, axisV, angle = widths
         area = beamNumber*np.pi*axisH*axisV
         if tilingShape == "circle":
             scale = np.sqrt(area/np.pi)*1.05